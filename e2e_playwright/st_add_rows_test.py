@@ -31,10 +31,9 @@ def test_correctly_adds_rows_to_charts(
     themed_app: Page, assert_snapshot: ImageCompareFunction
 ):
     charts = themed_app.get_by_test_id("stVegaLiteChart")
-    for index in range(charts.count()):
-        assert_snapshot(
-            charts.nth(index), name=f"st_vega_lite_chart-added_rows-{index}"
-        )
+    expect(charts).to_have_count(7)
+    for index, chart in enumerate(charts.all()):
+        assert_snapshot(chart, name=f"st_vega_lite_chart-added_rows-{index}")
 
 
 def test_correctly_adds_rows_to_dataframe(
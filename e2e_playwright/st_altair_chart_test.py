@@ -38,11 +38,11 @@ def test_altair_chart_displays_correctly(
         "st_altair_chart-grouped_layered_line_chart_streamlit_theme",
         "st_altair_chart-vconcat_width",
     ]
-    for i, name in enumerate(snapshot_names):
+    for name, chart in zip(snapshot_names, charts.all()):
         # We use a higher threshold here to prevent some flakiness
         # We should probably remove this once we have refactored the
         # altair frontend component.
-        assert_snapshot(charts.nth(i), name=name, image_threshold=0.6)
+        assert_snapshot(chart, name=name, image_threshold=0.6)
 
 
 def test_check_top_level_class(app: Page):
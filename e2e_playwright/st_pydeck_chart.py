@@ -21,6 +21,13 @@ import pydeck as pdk
 
 import streamlit as st
 
+SF_VIEW_STATE = pdk.ViewState(
+    latitude=37.76,
+    longitude=-122.4,
+    zoom=11,
+    pitch=50,
+)
+
 # Empty chart.
 
 st.pydeck_chart()
@@ -37,12 +44,7 @@ df = pd.DataFrame(
 st.pydeck_chart(
     pdk.Deck(
         map_style="mapbox://styles/mapbox/light-v9",
-        initial_view_state=pdk.ViewState(
-            latitude=37.76,
-            longitude=-122.4,
-            zoom=11,
-            pitch=50,
-        ),
+        initial_view_state=SF_VIEW_STATE,
         layers=[
             pdk.Layer(
                 "HexagonLayer",
@@ -109,12 +111,7 @@ st.pydeck_chart(
 
 st.pydeck_chart(
     pdk.Deck(
-        initial_view_state=pdk.ViewState(
-            latitude=37.76,
-            longitude=-122.4,
-            zoom=11,
-            pitch=50,
-        ),
+        initial_view_state=SF_VIEW_STATE,
         layers=[
             pdk.Layer(
                 "HexagonLayer",
@@ -20,7 +20,7 @@ cycle between streamlit.delta_generator and some elements.
 from __future__ import annotations
 
 from contextvars import ContextVar, Token
-from typing import TYPE_CHECKING, Callable, Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from streamlit.proto.RootContainer_pb2 import RootContainer as _RootContainer
 
@@ -84,6 +84,7 @@ class DeltaGeneratorSingleton:
         self._bottom_dg = delta_generator_cls(
             root_container=_RootContainer.BOTTOM, parent=self._main_dg
         )
+        context_dg_stack.set_default((self._main_dg,))
         self._status_container_cls = status_container_cls
         self._dialog_container_cls = dialog_container_cls
 
@@ -130,50 +131,54 @@ def get_dg_singleton_instance() -> DeltaGeneratorSingleton:
 _T = TypeVar("_T")
 
 
-class ContextVarWithLazyDefault(Generic[_T]):
+class ContextVarWithDeferredDefault(Generic[_T]):
     """The dg_stack tracks the currently active DeltaGenerator, and is pushed to when
     a DeltaGenerator is entered via a `with` block. This is implemented as a ContextVar
     so that different threads or async tasks can have their own stacks.
 
-    We have a wrapper around it because ContextVar default cannot be a function, but
-    the default dg (main_dg) might not exist yet when this module is imported.
+    We have a wrapper around it because the default dg (main_dg) doesn't exist yet
+    when this module is imported, so the ContextVar can't be created with its
+    default right away. DeltaGeneratorSingleton installs the default via
+    `set_default` once main_dg exists, which swaps in a new ContextVar, so `set`
+    and `reset` don't need to check for it on every call.
     """
 
-    def __init__(self, name: str, *, default: Callable[[], _T]):
+    __slots__ = ("_name", "_context_var")
+
+    def __init__(self, name: str):
         self._name = name
-        self._default = default
-        self._context_var: ContextVar[_T] | None = None
+        # Placeholder without a default until `set_default` is called.
+        self._context_var: ContextVar[_T] = ContextVar(name)
+
+    def set_default(self, default: _T) -> None:
+        """Install the underlying ContextVar with the given default value.
 
-    def _init_context_var(self) -> None:
-        self._context_var = ContextVar(self._name, default=self._default())
+        Until this is called, `get` raises a RuntimeError unless a value was set
+        in the current context.
+        """
+        self._context_var = ContextVar(self._name, default=default)
 
     def get(self) -> _T:
-        if self._context_var is None:
-            self._init_context_var()
-        return self._context_var.get()  # type: ignore[union-attr]
+        try:
+            return self._context_var.get()
+        except LookupError:
+            raise RuntimeError("DeltaGeneratorSingleton hasn't been created!") from None
 
     def set(self, value: _T) -> Token[_T]:
-        if self._context_var is None:
-            self._init_context_var()
-        return self._context_var.set(value)  # type: ignore[union-attr]
+        return self._context_var.set(value)
 
     def reset(self, token: Token[_T]) -> None:
-        if self._context_var is None:
-            self._init_context_var()
-        self._context_var.reset(token)  # type: ignore[union-attr]
+        self._context_var.reset(token)
 
     def __hash__(self) -> int:
-        if self._context_var is None:
-            self._init_context_var()
         return self._context_var.__hash__()
 
 
-# we don't use the default factory here because `main_dg` is not initialized when this
-# module is imported. This is why we have our own ContextVar wrapper.
-context_dg_stack: ContextVarWithLazyDefault[tuple[DeltaGenerator, ...]] = (
-    ContextVarWithLazyDefault(
-        "context_dg_stack", default=lambda: (get_dg_singleton_instance().main_dg,)
-    )
+# we can't pass the default to the ContextVar here because `main_dg` is not
+# initialized when this module is imported. The default is set by
+# DeltaGeneratorSingleton once `main_dg` is created.
+context_dg_stack: ContextVarWithDeferredDefault[tuple[DeltaGenerator, ...]] = (
+    ContextVarWithDeferredDefault("context_dg_stack")
 )
 
 
@@ -199,6 +204,4 @@ def get_last_dg_added_to_context_stack() -> DeltaGenerator | None:
     # but do not populate the dg_stack correctly. However, to be on the safe-side,
     # we keep the logic but leave the comment as shared knowledge for whoever will look
     # into this in the future.
-    if len(current_stack) > 1:
-        return current_stack[-1]
-    return None
+    return current_stack[-1] if len(current_stack) > 1 else None
@@ -21,7 +21,6 @@ from typing import TYPE_CHECKING, Any, Dict, Final, Mapping, cast
 from streamlit import config
 from streamlit.proto.DeckGlJsonChart_pb2 import DeckGlJsonChart as PydeckProto
 from streamlit.runtime.metrics_util import gather_metrics
-from streamlit.util import HASHLIB_KWARGS
 
 if TYPE_CHECKING:
     from pydeck import Deck
@@ -34,6 +33,9 @@ EMPTY_MAP: Final[Mapping[str, Any]] = {
     "initialViewState": {"latitude": 0, "longitude": 0, "pitch": 0, "zoom": 1},
 }
 
+# JSON encoding of EMPTY_MAP. It never changes, so we only encode it once.
+_EMPTY_MAP_JSON: Final[str] = json.dumps(EMPTY_MAP)
+
 
 class PydeckMixin:
     @gather_metrics("pydeck_chart")
@@ -169,13 +171,12 @@ def marshall(
     use_container_width: bool,
 ) -> None:
     if pydeck_obj is None:
-        spec = json.dumps(EMPTY_MAP)
+        spec = _EMPTY_MAP_JSON
         id = ""
     else:
         spec = pydeck_obj.to_json()
-        json_string = json.dumps(spec)
-        json_bytes = json_string.encode("utf-8")
-        id = hashlib.md5(json_bytes, **HASHLIB_KWARGS).hexdigest()
+        # to_json already returns a JSON string, so we can hash it directly.
+        id = hashlib.blake2b(spec.encode("utf-8"), digest_size=16).hexdigest()
 
     pydeck_proto.json = spec
     pydeck_proto.use_container_width = use_container_width
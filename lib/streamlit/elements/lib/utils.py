@@ -43,7 +43,6 @@ from streamlit.runtime.state.common import (
     RegisterWidgetResult,
     user_key_from_element_id,
 )
-from streamlit.util import HASHLIB_KWARGS
 
 if TYPE_CHECKING:
     from builtins import ellipsis
@@ -295,6 +294,12 @@ def _register_element_id(element_type: str, element_id: str) -> None:
         raise StreamlitDuplicateElementId(element_type)
 
 
+# Hash objects that have already been fed the element type, keyed by element type.
+# Copying one of these is cheaper than creating and seeding a new hash object for
+# every element. They must never be updated directly.
+_ELEMENT_ID_HASH_PROTOTYPES: dict[str, Any] = {}
+
+
 def _compute_element_id(
     element_type: str,
     user_key: str | None = None,
@@ -311,14 +316,26 @@ def _compute_element_id(
     use it to be distinct. The element ID includes an easily identified prefix, and the
     user_key as a suffix, to make it easy to identify it and know if a key maps to it.
     """
-    h = hashlib.new("md5", **HASHLIB_KWARGS)
-    h.update(element_type.encode("utf-8"))
+    prototype = _ELEMENT_ID_HASH_PROTOTYPES.get(element_type)
+    if prototype is None:
+        prototype = hashlib.blake2b(element_type.encode("utf-8"), digest_size=16)
+        _ELEMENT_ID_HASH_PROTOTYPES[element_type] = prototype
+    h = prototype.copy()
+
+    parts = []
     # This will iterate in a consistent order when the provided arguments have
     # consistent order; dicts are always in insertion order.
     for k, v in kwargs.items():
-        h.update(str(k).encode("utf-8"))
-        h.update(str(v).encode("utf-8"))
-    return f"{GENERATED_ELEMENT_ID_PREFIX}-{h.hexdigest()}-{user_key}"
+        parts.append(str(k))
+        parts.append(str(v))
+    # Hashing the joined string in one go produces the same digest as updating
+    # the hash part by part, but with a single encode and update call.
+    h.update("".join(parts).encode("utf-8"))
+    # Formatting None in an f-string goes through the generic format() machinery,
+    # so we substitute its string representation directly for the common
+    # no-user-key case.
+    user_key_str = "None" if user_key is None else user_key
+    return f"{GENERATED_ELEMENT_ID_PREFIX}-{h.hexdigest()}-{user_key_str}"
 
 
 def compute_and_register_element_id(
@@ -32,62 +32,68 @@ from typing import (
     get_args,
 )
 
+from google.protobuf.message import Message
 from typing_extensions import TypeAlias, TypeGuard
 
 from streamlit import config, util
 from streamlit.errors import (
     StreamlitAPIException,
 )
-from streamlit.proto.Arrow_pb2 import Arrow
-from streamlit.proto.ArrowVegaLiteChart_pb2 import ArrowVegaLiteChart
-from streamlit.proto.Button_pb2 import Button
-from streamlit.proto.ButtonGroup_pb2 import ButtonGroup
-from streamlit.proto.CameraInput_pb2 import CameraInput
-from streamlit.proto.ChatInput_pb2 import ChatInput
-from streamlit.proto.Checkbox_pb2 import Checkbox
-from streamlit.proto.ColorPicker_pb2 import ColorPicker
-from streamlit.proto.Components_pb2 import ComponentInstance
-from streamlit.proto.DateInput_pb2 import DateInput
-from streamlit.proto.DownloadButton_pb2 import DownloadButton
-from streamlit.proto.FileUploader_pb2 import FileUploader
-from streamlit.proto.MultiSelect_pb2 import MultiSelect
-from streamlit.proto.NumberInput_pb2 import NumberInput
-from streamlit.proto.PlotlyChart_pb2 import PlotlyChart
-from streamlit.proto.Radio_pb2 import Radio
-from streamlit.proto.Selectbox_pb2 import Selectbox
-from streamlit.proto.Slider_pb2 import Slider
-from streamlit.proto.TextArea_pb2 import TextArea
-from streamlit.proto.TextInput_pb2 import TextInput
-from streamlit.proto.TimeInput_pb2 import TimeInput
 
 if TYPE_CHECKING:
+    from streamlit.proto.Arrow_pb2 import Arrow
+    from streamlit.proto.ArrowVegaLiteChart_pb2 import ArrowVegaLiteChart
+    from streamlit.proto.Button_pb2 import Button
+    from streamlit.proto.ButtonGroup_pb2 import ButtonGroup
+    from streamlit.proto.CameraInput_pb2 import CameraInput
+    from streamlit.proto.ChatInput_pb2 import ChatInput
+    from streamlit.proto.Checkbox_pb2 import Checkbox
+    from streamlit.proto.ColorPicker_pb2 import ColorPicker
+    from streamlit.proto.Components_pb2 import ComponentInstance
+    from streamlit.proto.DateInput_pb2 import DateInput
+    from streamlit.proto.DownloadButton_pb2 import DownloadButton
+    from streamlit.proto.FileUploader_pb2 import FileUploader
+    from streamlit.proto.MultiSelect_pb2 import MultiSelect
+    from streamlit.proto.NumberInput_pb2 import NumberInput
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart
+    from streamlit.proto.Radio_pb2 import Radio
+    from streamlit.proto.Selectbox_pb2 import Selectbox
+    from streamlit.proto.Slider_pb2 import Slider
+    from streamlit.proto.TextArea_pb2 import TextArea
+    from streamlit.proto.TextInput_pb2 import TextInput
+    from streamlit.proto.TimeInput_pb2 import TimeInput
     from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
 
 
-# Protobuf types for all widgets.
-WidgetProto: TypeAlias = Union[
-    Arrow,
-    ArrowVegaLiteChart,
-    Button,
-    ButtonGroup,
-    CameraInput,
-    ChatInput,
-    Checkbox,
-    ColorPicker,
-    ComponentInstance,
-    DateInput,
-    DownloadButton,
-    FileUploader,
-    MultiSelect,
-    NumberInput,
-    PlotlyChart,
-    Radio,
-    Selectbox,
-    Slider,
-    TextArea,
-    TextInput,
-    TimeInput,
-]
+if TYPE_CHECKING:
+    # Protobuf types for all widgets.
+    WidgetProto: TypeAlias = Union[
+        Arrow,
+        ArrowVegaLiteChart,
+        Button,
+        ButtonGroup,
+        CameraInput,
+        ChatInput,
+        Checkbox,
+        ColorPicker,
+        ComponentInstance,
+        DateInput,
+        DownloadButton,
+        FileUploader,
+        MultiSelect,
+        NumberInput,
+        PlotlyChart,
+        Radio,
+        Selectbox,
+        Slider,
+        TextArea,
+        TextInput,
+        TimeInput,
+    ]
+else:
+    # The precise union only matters to type checkers. At runtime, all widget
+    # protos are protobuf messages.
+    WidgetProto: TypeAlias = Message
 
 GENERATED_ELEMENT_ID_PREFIX: Final = "$$ID"
 TESTING_KEY = "$$STREAMLIT_INTERNAL_KEY_TESTING"
@@ -199,9 +205,23 @@ class RegisterWidgetResult(Generic[T_co]):
         Implies an update to the frontend is needed.
     """
 
+    # A result is created for every widget on every script run, so we don't
+    # give it an instance __dict__. This is declared by hand rather than with
+    # `@dataclass(slots=True)`, which requires Python 3.10.
+    __slots__ = ("value", "value_changed")
+
     value: T_co
     value_changed: bool
 
+    # Frozen dataclasses with slots need explicit state handling to support
+    # pickling and copying, as `@dataclass(slots=True)` would generate it.
+    def __getstate__(self) -> tuple[T_co, bool]:
+        return (self.value, self.value_changed)
+
+    def __setstate__(self, state: tuple[T_co, bool]) -> None:
+        object.__setattr__(self, "value", state[0])
+        object.__setattr__(self, "value_changed", state[1])
+
     @classmethod
     def failure(
         cls, deserializer: WidgetDeserializer[T_co]
@@ -233,7 +253,9 @@ def is_keyed_element_id(key: str) -> bool:
     """True if the given session_state key has the structure of a element ID
     with a user_key.
     """
-    return is_element_id(key) and not key.endswith("-None")
+    # The prefix check is inlined instead of calling is_element_id since this runs
+    # for every session_state key.
+    return key.startswith(GENERATED_ELEMENT_ID_PREFIX) and not key.endswith("-None")
 
 
 def require_valid_user_key(key: str) -> None:
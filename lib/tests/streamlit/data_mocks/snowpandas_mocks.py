@@ -41,7 +41,7 @@ class DataFrame:
 
     def head(self, n: int) -> DataFrame:
         """Returns the top n element of a mock version of Snowpark Pandas DataFrame"""
-        return DataFrame(self[:n])
+        return DataFrame(self._data.head(n))
 
     def __getitem__(self, key: slice | int) -> DataFrame:
         # Allow slicing and integer indexing
@@ -69,7 +69,7 @@ class Series:
 
     def head(self, n: int) -> Series:
         """Returns the top n element of a mock version of Snowpark Pandas Series"""
-        return Series(self[:n])
+        return Series(self._data.head(n))
 
     def __getitem__(self, key: slice | int) -> Series:
         # Allow slicing and integer indexing
@@ -97,7 +97,7 @@ class Index:
 
     def head(self, n: int) -> Index:
         """Returns the top n element of a mock version of Snowpark Pandas Series"""
-        return Index(self[:n])
+        return Index(self._data[:n])
 
     def __getitem__(self, key: slice | int) -> Index:
         # Allow slicing and integer indexing
@@ -137,6 +137,21 @@ def data_generator():
     yield "st.text_input"
 
 
+# Shared by all the mock wrappers below. The mocks only keep a reference to
+# the wrapped data, so it is safe to reuse the same instances.
+_WIDGET_ELEMENT_DF = pd.DataFrame(
+    {
+        "name": ["st.text_area", "st.markdown"],
+        "type": ["widget", "element"],
+    }
+)
+_WIDGET_ELEMENT_SERIES = pd.Series(["st.text_area", "st.markdown"])
+# Shared by the dict wrapper cases. defaultdict and UserDict copy it and
+# MappingProxyType only exposes a read-only view, so it is never mutated.
+_WIDGET_ELEMENT_DICT = {"st.text_area": "widget", "st.markdown": "element"}
+# Shared by the pd.Dataframe, Styler and pyarrow Table cases.
+_WIDGET_NAMES_DF = pd.DataFrame(["st.text_area", "st.markdown"])
+
 SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ###################################
     ####### Native Python Types #######
@@ -218,7 +233,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
         "Set[str]",
         # Set does not have a stable order across different Python version.
         # Therefore, we are only testing this with one item.
-        {"st.number_input", "st.number_input"},  # noqa: B033
+        {"st.number_input"},
         CaseMetadata(
             1, 1, DataFormat.SET_OF_VALUES, ["st.number_input"], "markdown", False
         ),
@@ -239,7 +254,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
         "Frozenset[str]",
         # Set does not have a stable order across different Python version.
         # Therefore, we are only testing this with one item.
-        frozenset({"st.number_input", "st.number_input"}),  # noqa: B033
+        frozenset({"st.number_input"}),
         CaseMetadata(
             1,
             1,
@@ -339,7 +354,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
         "collections.defaultdict",
         defaultdict(
             lambda: "Not Present",
-            {"st.text_area": "widget", "st.markdown": "element"},
+            _WIDGET_ELEMENT_DICT,
         ),
         CaseMetadata(
             2,
@@ -499,7 +514,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "MappingProxyType",
-        MappingProxyType({"st.text_area": "widget", "st.markdown": "element"}),
+        MappingProxyType(_WIDGET_ELEMENT_DICT),
         CaseMetadata(
             2,
             1,
@@ -512,7 +527,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "UserDict",
-        UserDictExample({"st.text_area": "widget", "st.markdown": "element"}),
+        UserDictExample(_WIDGET_ELEMENT_DICT),
         CaseMetadata(
             2,
             1,
@@ -627,7 +642,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "pd.Dataframe",
-        pd.DataFrame(["st.text_area", "st.markdown"]),
+        _WIDGET_NAMES_DF,
         CaseMetadata(
             2,
             1,
@@ -667,7 +682,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "Pandas Styler",
-        pd.DataFrame(["st.text_area", "st.markdown"]).style,
+        _WIDGET_NAMES_DF.style,
         CaseMetadata(
             2,
             1,
@@ -720,7 +735,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     (
         "Empty np.array",
         # For unknown reasons, pd.DataFrame initializes empty numpy arrays with a single column
-        np.ndarray(0),
+        np.empty(0),
         CaseMetadata(0, 1, DataFormat.NUMPY_LIST, [], "dataframe", False),
     ),
     (
@@ -779,7 +794,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ###################################
     (
         "Pyarrow Table",
-        pa.Table.from_pandas(pd.DataFrame(["st.text_area", "st.markdown"])),
+        pa.Table.from_pandas(_WIDGET_NAMES_DF),
         CaseMetadata(
             2,
             1,
@@ -806,14 +821,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ###################################
     (
         "Snowpark DataFrame",
-        SnowparkDataFrame(
-            pd.DataFrame(
-                [
-                    {"name": "st.text_area", "type": "widget"},
-                    {"name": "st.markdown", "type": "element"},
-                ]
-            )
-        ),
+        SnowparkDataFrame(_WIDGET_ELEMENT_DF),
         CaseMetadata(
             2,
             2,
@@ -826,14 +834,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "Snowpark Table",
-        SnowparkTable(
-            pd.DataFrame(
-                [
-                    {"name": "st.text_area", "type": "widget"},
-                    {"name": "st.markdown", "type": "element"},
-                ]
-            )
-        ),
+        SnowparkTable(_WIDGET_ELEMENT_DF),
         CaseMetadata(
             2,
             2,
@@ -863,14 +864,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "Snowpandas DataFrame",
-        SnowpandasDataFrame(
-            pd.DataFrame(
-                [
-                    {"name": "st.text_area", "type": "widget"},
-                    {"name": "st.markdown", "type": "element"},
-                ]
-            )
-        ),
+        SnowpandasDataFrame(_WIDGET_ELEMENT_DF),
         CaseMetadata(
             2,
             2,
@@ -883,7 +877,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "Snowpandas Series",
-        SnowpandasSeries(pd.Series(["st.text_area", "st.markdown"])),
+        SnowpandasSeries(_WIDGET_ELEMENT_SERIES),
         CaseMetadata(
             2,
             1,
@@ -911,14 +905,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "Modin DataFrame",
-        ModinDataFrame(
-            pd.DataFrame(
-                [
-                    {"name": "st.text_area", "type": "widget"},
-                    {"name": "st.markdown", "type": "element"},
-                ]
-            )
-        ),
+        ModinDataFrame(_WIDGET_ELEMENT_DF),
         CaseMetadata(
             2,
             2,
@@ -931,7 +918,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "Modin Series",
-        ModinSeries(pd.Series(["st.text_area", "st.markdown"])),
+        ModinSeries(_WIDGET_ELEMENT_SERIES),
         CaseMetadata(
             2,
             1,
@@ -947,14 +934,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ###################################
     (
         "Pyspark DataFrame",
-        PySparkDataFrame(
-            pd.DataFrame(
-                [
-                    {"name": "st.text_area", "type": "widget"},
-                    {"name": "st.markdown", "type": "element"},
-                ]
-            )
-        ),
+        PySparkDataFrame(_WIDGET_ELEMENT_DF),
         CaseMetadata(
             2,
             2,
@@ -967,14 +947,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "Dask DataFrame",
-        DaskDataFrame(
-            pd.DataFrame(
-                [
-                    {"name": "st.text_area", "type": "widget"},
-                    {"name": "st.markdown", "type": "element"},
-                ]
-            )
-        ),
+        DaskDataFrame(_WIDGET_ELEMENT_DF),
         CaseMetadata(
             2,
             2,
@@ -987,7 +960,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "Dask Series",
-        DaskSeries(pd.Series(["st.text_area", "st.markdown"])),
+        DaskSeries(_WIDGET_ELEMENT_SERIES),
         CaseMetadata(
             2,
             1,
@@ -1015,14 +988,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "Ray Dataset",
-        RayDataset(
-            pd.DataFrame(
-                [
-                    {"name": "st.text_area", "type": "widget"},
-                    {"name": "st.markdown", "type": "element"},
-                ]
-            )
-        ),
+        RayDataset(_WIDGET_ELEMENT_DF),
         CaseMetadata(
             2,
             2,
@@ -1035,14 +1001,7 @@ SHARED_TEST_CASES: list[tuple[str, Any, CaseMetadata]] = [
     ),
     (
         "Ray Materialized Dataset",
-        RayMaterializedDataset(
-            pd.DataFrame(
-                [
-                    {"name": "st.text_area", "type": "widget"},
-                    {"name": "st.markdown", "type": "element"},
-                ]
-            )
-        ),
+        RayMaterializedDataset(_WIDGET_ELEMENT_DF),
         CaseMetadata(
             2,
             2,
@@ -1063,14 +1022,7 @@ if is_pandas_version_less_than("1.5.0") is False:
         [
             (
                 "Dataframe-interchange compatible",
-                CustomDataframe(
-                    pd.DataFrame(
-                        [
-                            {"name": "st.text_area", "type": "widget"},
-                            {"name": "st.markdown", "type": "element"},
-                        ]
-                    )
-                ),
+                CustomDataframe(_WIDGET_ELEMENT_DF),
                 CaseMetadata(
                     2,
                     2,
@@ -1095,10 +1047,10 @@ try:
             (
                 "Polars DataFrame",
                 pl.DataFrame(
-                    [
-                        {"name": "st.text_area", "type": "widget"},
-                        {"name": "st.markdown", "type": "element"},
-                    ]
+                    {
+                        "name": ["st.text_area", "st.markdown"],
+                        "type": ["widget", "element"],
+                    }
                 ),
                 CaseMetadata(
                     2,
@@ -17,6 +17,7 @@ import unittest
 import streamlit as st
 from streamlit.delta_generator import DeltaGenerator
 from streamlit.delta_generator_singletons import (
+    ContextVarWithDeferredDefault,
     context_dg_stack,
     get_default_dg_stack_value,
     get_dg_singleton_instance,
@@ -57,6 +58,15 @@ class DeltaGeneratorSingletonsTest(unittest.TestCase):
         dg_stack = context_dg_stack.get()
         assert len(dg_stack) == 1
 
+    def test_context_var_get_before_default_is_set(self):
+        context_var = ContextVarWithDeferredDefault("test_context_var")
+        with self.assertRaises(RuntimeError) as e:
+            context_var.get()
+        assert str(e.exception) == "DeltaGeneratorSingleton hasn't been created!"
+
+        context_var.set_default(("default",))
+        assert context_var.get() == ("default",)
+
 
 class DeltaGeneratorSingletonsVariablesAreInitializedTest(unittest.TestCase):
     """dg variables are initialized by Streamlit.__init__.py"""
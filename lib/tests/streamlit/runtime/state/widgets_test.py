@@ -14,7 +14,9 @@
 
 """Tests widget-related functionality"""
 
+import copy
 import inspect
+import pickle
 import unittest
 from unittest.mock import ANY, MagicMock, call, patch
 
@@ -29,6 +31,7 @@ from streamlit.runtime.scriptrunner_utils.script_requests import _coalesce_widge
 from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
 from streamlit.runtime.state.common import (
     GENERATED_ELEMENT_ID_PREFIX,
+    RegisterWidgetResult,
 )
 from streamlit.runtime.state.session_state import SessionState, WidgetMetadata
 from streamlit.runtime.state.widgets import user_key_from_element_id
@@ -335,6 +338,12 @@ class WidgetHelperTests(unittest.TestCase):
         id = compute_and_register_element_id("button", label="the label")
         assert id.startswith(GENERATED_ELEMENT_ID_PREFIX)
 
+    def test_register_widget_result_can_be_copied_and_pickled(self):
+        result = RegisterWidgetResult(["st.text_area"], value_changed=True)
+        assert not hasattr(result, "__dict__")
+        assert copy.deepcopy(result) == result
+        assert pickle.loads(pickle.dumps(result)) == result
+
 
 class ComputeWidgetIdTests(DeltaGeneratorTestCase):
     """Enforce that new arguments added to the signature of a widget function are taken